@@ -1,10 +1,102 @@
-import os, re, html, json, time, smtplib, datetime, requests, feedparser, yaml, difflib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
+import os, re, html, json, time, asyncio, hashlib, smtplib, datetime, functools, requests, feedparser, yaml, difflib
+import atexit, threading
+import email.utils
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.message import EmailMessage
 from dotenv import load_dotenv
-from urllib.parse import urlparse
+from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
 from collections import Counter
-from openai import OpenAI
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from openai import OpenAI, AsyncOpenAI
+
+# We strip all markup ourselves (strip_tags), so feedparser's per-entry HTML
+# sanitizer and relative-URI resolver are pure overhead — skip them.
+feedparser.SANITIZE_HTML = 0
+feedparser.RESOLVE_RELATIVE_URIS = 0
+
+# ---------- Optional on-disk cache for LLM output ----------
+HAS_DISKCACHE = False
+try:
+    import diskcache
+    HAS_DISKCACHE = True
+except Exception:
+    HAS_DISKCACHE = False
+
+# ---------- Optional dateutil (lenient date parsing fallback) ----------
+HAS_DATEUTIL = False
+try:
+    from dateutil import parser as _dateutil_parser
+    HAS_DATEUTIL = True
+except Exception:
+    HAS_DATEUTIL = False
+
+# ---------- Optional lxml (streaming RSS parse) ----------
+HAS_LXML = False
+try:
+    from lxml import etree as _lxml_etree
+    from lxml import html as _lxml_html
+    HAS_LXML = True
+except Exception:
+    HAS_LXML = False
+
+# ---------- Optional numpy (vectorized cosine for near-dup collapsing) ----------
+HAS_NUMPY = False
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except Exception:
+    HAS_NUMPY = False
+
+# ---------- Optional C-accelerated JSON ----------
+HAS_ORJSON = False
+try:
+    import orjson
+    HAS_ORJSON = True
+except Exception:
+    HAS_ORJSON = False
+
+def _json_loads(raw):
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _json_dumps(obj):
+    if HAS_ORJSON:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+# ---------- Optional async HTTP (HTTP/2 multiplexing) ----------
+HAS_HTTPX = False
+try:
+    import httpx
+    HAS_HTTPX = True
+except Exception:
+    HAS_HTTPX = False
+
+# ---------- Optional Aho-Corasick multi-pattern matching ----------
+HAS_AHOCORASICK = False
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except Exception:
+    HAS_AHOCORASICK = False
+
+# ---------- Optional C-backed HTML stripping ----------
+HAS_SELECTOLAX = False
+try:
+    from selectolax.parser import HTMLParser
+    HAS_SELECTOLAX = True
+except Exception:
+    HAS_SELECTOLAX = False
+
+# ---------- Optional C-backed fuzzy title matching ----------
+HAS_RAPIDFUZZ = False
+try:
+    from rapidfuzz import fuzz as _rf_fuzz
+    HAS_RAPIDFUZZ = True
+except Exception:
+    HAS_RAPIDFUZZ = False
 
 # ---------- Optional Google Sheets logging ----------
 HAS_SHEETS = False
@@ -20,6 +112,11 @@ load_dotenv()
 # ---------- Env / Secrets ----------
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 MODEL = os.getenv("OPENAI_MODEL", "gpt-5")
+# cards are short deterministic rewrites — a small model is plenty; the
+# top-tier MODEL is reserved for the trends synthesis (and as the
+# escalation target when a mini card fails validation).
+# SUMMARY_MODEL is accepted as an alias
+SUMMARY_MODEL = os.getenv("OPENAI_SUMMARY_MODEL", os.getenv("SUMMARY_MODEL", "gpt-4o-mini"))
 
 TO_EMAIL = os.getenv("TO_EMAIL")
 FROM_EMAIL = os.getenv("FROM_EMAIL", os.getenv("SMTP_USER"))
@@ -49,11 +146,112 @@ assert FROM_EMAIL, "FROM_EMAIL is required"
 assert SMTP_SERVER and SMTP_PORT and SMTP_USER and SMTP_PASS, "SMTP settings are required"
 
 client = OpenAI(api_key=OPENAI_API_KEY)
+aclient = AsyncOpenAI(api_key=OPENAI_API_KEY)
+
+# How many OpenAI requests may be in flight at once (keeps us under RPM caps);
+# LLM_WORKERS is accepted as an alias
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", os.getenv("LLM_WORKERS", "8")))
+
+# Upper bound on concurrent feed downloads
+FETCH_WORKERS = int(os.getenv("FETCH_WORKERS", "16"))
+
+# ---------- Summary cache (skip OpenAI for items we already summarized) ----------
+SUMMARY_CACHE_DIR = os.getenv("SUMMARY_CACHE_DIR", ".cache/summaries")
+SUMMARY_CACHE_TTL = 30 * 86400
+
+_summary_cache = diskcache.Cache(SUMMARY_CACHE_DIR) if HAS_DISKCACHE else None
+
+def _summary_cache_key(it, kind="card"):
+    raw = f"{kind}|{SUMMARY_MODEL}|{it.get('link','')}|{it.get('title','')}|{(it.get('summary') or '')[:500]}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def summary_cache_get(it, kind="card"):
+    if _summary_cache is None:
+        return None
+    hit = _summary_cache.get(_summary_cache_key(it, kind))
+    if hit is None and it.get("link"):
+        # fallback: same link with an edited title/summary still counts
+        hit = _summary_cache.get(f"link:{kind}:{it['link']}")
+    return hit
+
+def summary_cache_set(it, value, kind="card"):
+    if _summary_cache is None:
+        return
+    _summary_cache.set(_summary_cache_key(it, kind), value, expire=SUMMARY_CACHE_TTL)
+    if it.get("link"):
+        _summary_cache.set(f"link:{kind}:{it['link']}", value, expire=SUMMARY_CACHE_TTL)
+
+# Exact-match response cache for the JSON LLM helpers: an identical
+# (model, system, prompt, temperature) request returns the stored parse
+# without a round-trip. 14 days covers two lookback windows, where weekly
+# feed overlap makes repeats common.
+LLM_CACHE_TTL = int(os.getenv("LLM_CACHE_TTL", 14 * 86400))
+
+# every call in this script uses temperature <= 0.2 (deterministic
+# rewrites); anything hotter is treated as intentionally varied output
+# and bypasses the cache
+LLM_CACHE_MAX_TEMP = 0.2
+
+_llm_cache_stats = {"hits": 0, "misses": 0}
+
+def _llm_cache_key(model, system, prompt, temperature):
+    if temperature > LLM_CACHE_MAX_TEMP:
+        return None
+    raw = f"llm|{model}|{temperature}|{system}|{prompt}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+def _llm_cache_get(key):
+    if _summary_cache is None or key is None:
+        return None
+    hit = _summary_cache.get(key)
+    _llm_cache_stats["hits" if hit is not None else "misses"] += 1
+    return hit
+
+def _llm_cache_set(key, value):
+    if _summary_cache is not None and key is not None:
+        _summary_cache.set(key, value, expire=LLM_CACHE_TTL)
+
+# Section caches serve stale-while-revalidate: entries younger than the
+# fresh TTL are returned as-is; older (but within the stale TTL) entries are
+# still served while a background refresh recomputes them for the next run.
+SECTION_FRESH_TTL = int(os.getenv("SECTION_FRESH_TTL", 6 * 3600))
+SECTION_STALE_TTL = int(os.getenv("SECTION_STALE_TTL", 48 * 3600))
+
+_swr_refresh = ThreadPoolExecutor(max_workers=1)
+
+def section_cache_get(key):
+    """Return (value, stale); value is None on a miss."""
+    if _summary_cache is None:
+        return None, False
+    hit = _summary_cache.get(key)
+    if not isinstance(hit, dict) or "v" not in hit:
+        return None, False
+    return hit["v"], (time.time() - hit.get("t", 0)) > SECTION_FRESH_TTL
+
+def section_cache_set(key, value):
+    if _summary_cache is not None:
+        _summary_cache.set(key, {"v": value, "t": time.time()},
+                           expire=SECTION_STALE_TTL)
+
+# ---------- Shared HTTP session (keep-alive + retry w/ backoff) ----------
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16, pool_maxsize=16,
+    max_retries=Retry(total=5, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504]),
+))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
 
 # ---------- Sources ----------
+try:
+    from yaml import CSafeLoader as _YamlLoader  # libyaml, ~10x faster
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+@functools.lru_cache(maxsize=1)
 def load_sources(path="sources.yaml"):
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 # ---------- Helpers ----------
 def within_lookback(published_struct, days=None):
@@ -63,51 +261,324 @@ def within_lookback(published_struct, days=None):
     now = datetime.datetime.utcnow()
     return (now - published) <= datetime.timedelta(days=(days or LOOKBACK_DAYS))
 
-def strip_tags(text):
-    return re.sub(r"<[^>]+>", "", text or "")
+_TAG_RE = re.compile(r"<[^>]+>")
 
-def fetch_feed(url):
+def strip_tags(text, max_chars=2500):
+    """Strip markup, stopping once ``max_chars`` of text have accumulated.
+
+    Every caller caps the result anyway, so on very long entries there is no
+    point stripping (or even copying) the tail. Pass ``max_chars=None`` for
+    the unbounded behaviour.
+    """
+    if not text:
+        return ""
+    if HAS_SELECTOLAX and "<" in text:
+        try:
+            out = HTMLParser(text).text(separator=" ")
+            return out[:max_chars] if max_chars else out
+        except Exception:
+            pass
+    parts, pos, n = [], 0, 0
+    for m in _TAG_RE.finditer(text):
+        parts.append(text[pos:m.start()])
+        n += m.start() - pos
+        pos = m.end()
+        if max_chars and n >= max_chars:
+            break
+    else:
+        parts.append(text[pos:])
+    s = "".join(parts)
+    return s[:max_chars] if max_chars else s
+
+# ---------- Feed conditional-GET state (ETag / Last-Modified) ----------
+FEED_STATE_PATH = os.getenv("FEED_STATE_PATH", ".feedcache.json")
+
+def _load_feed_state(path=FEED_STATE_PATH):
     try:
-        return feedparser.parse(url)
+        with open(path, "r", encoding="utf-8") as f:
+            data = _json_loads(f.read())
+            return data if isinstance(data, dict) else {}
     except Exception:
+        return {}
+
+FEED_STATE = _load_feed_state()
+
+def save_feed_state(path=FEED_STATE_PATH):
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(_json_dumps(FEED_STATE))
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+class _CachedFeed:
+    """Duck-typed stand-in for a feedparser result, built from cached entries."""
+    bozo = 0
+
+    def __init__(self, entries):
+        self.entries = entries or []
+
+def _snapshot_entries(d):
+    """JSON-serializable copy of the entry fields extraction actually reads."""
+    entries = []
+    for e in d.entries:
+        published = e.get("published_parsed") or e.get("updated_parsed")
+        entries.append({
+            "title": e.get("title"),
+            "link": e.get("link"),
+            "summary": e.get("summary") or e.get("description"),
+            "published_parsed": list(published)[:6] if published else None,
+        })
+    return entries
+
+def _parse_pubdate(raw):
+    """Feed date string -> naive UTC datetime, or None.
+
+    email.utils handles the RFC-822 dates RSS mandates in pure C-speed
+    stdlib code (feedparser's own date parser is the hot spot when building
+    entries); dateutil, when installed, mops up ISO-8601 and other stragglers.
+    """
+    if not raw:
+        return None
+    dt = None
+    try:
+        dt = email.utils.parsedate_to_datetime(raw)
+    except Exception:
+        dt = None
+    if dt is None and HAS_DATEUTIL:
+        try:
+            dt = _dateutil_parser.parse(raw)
+        except Exception:
+            dt = None
+    if dt is None:
         return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return dt
+
+def _parse_feed_stream(url, state):
+    """Stream-parse an RSS feed with lxml iterparse, stopping early.
+
+    Reads <item> elements off the wire and bails once enough recent items
+    were seen or the first out-of-lookback item appears (feeds are newest
+    first), instead of letting feedparser materialize the whole document.
+    Returns None when the document yields no <item>s (e.g. Atom) so the
+    caller can fall back to feedparser.
+    """
+    headers = {"User-Agent": "digest/1.0", "Accept-Encoding": "gzip"}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("modified"):
+        headers["If-Modified-Since"] = state["modified"]
+    r = _SESSION.get(url, timeout=(3, 10), stream=True, headers=headers)
+    try:
+        if r.status_code == 304:
+            return _CachedFeed(state.get("entries"))
+        r.raise_for_status()
+        r.raw.decode_content = True
+        cutoff = datetime.datetime.utcnow() - datetime.timedelta(days=LOOKBACK_DAYS)
+        limit = MAX_ITEMS_PER_SECTION * 2 if MAX_ITEMS_PER_SECTION > 0 else 0
+        entries = []
+        for _, el in _lxml_etree.iterparse(r.raw, events=("end",), tag="item"):
+            published = _parse_pubdate(el.findtext("pubDate"))
+            too_old = published is not None and published < cutoff
+            if not too_old:
+                entries.append({
+                    "title": (el.findtext("title") or "").strip(),
+                    "link": (el.findtext("link") or "").strip(),
+                    "summary": el.findtext("description") or "",
+                    "published_parsed": list(published.timetuple())[:6] if published else None,
+                })
+            el.clear()
+            if too_old or (limit and len(entries) >= limit):
+                break
+    finally:
+        r.close()
+    if not entries:
+        return None
+    etag = r.headers.get("ETag")
+    modified = r.headers.get("Last-Modified")
+    if etag or modified:
+        FEED_STATE[url] = {"etag": etag, "modified": modified, "entries": entries}
+    return _CachedFeed(entries)
 
-def collect_rss_items(section_name, urls, *, lookback_days=None):
+def fetch_feed(url):
+    state = FEED_STATE.get(url) or {}
+    if HAS_LXML:
+        try:
+            d = _parse_feed_stream(url, state)
+            if d is not None:
+                return d
+        except Exception:
+            pass  # any transport/parse hiccup: let feedparser have a go
+    # fetch the body ourselves (bounded timeout, shared pool) and hand the
+    # bytes to feedparser — parse(url) would block with no timeout at all
+    headers = {"User-Agent": "digest/1.0"}
+    if state.get("etag"):
+        headers["If-None-Match"] = state["etag"]
+    if state.get("modified"):
+        headers["If-Modified-Since"] = state["modified"]
+    try:
+        r = _SESSION.get(url, timeout=(3, 10), headers=headers)
+        if r.status_code == 304:
+            # unchanged since last run: reuse the entries we kept with the state
+            return _CachedFeed(state.get("entries"))
+        r.raise_for_status()
+        d = feedparser.parse(r.content)
+    except Exception:
+        return None
+    etag = r.headers.get("ETag")
+    modified = r.headers.get("Last-Modified")
+    if etag or modified:
+        FEED_STATE[url] = {"etag": etag, "modified": modified,
+                           "entries": _snapshot_entries(d)}
+    return d
+
+def extract_feed_items(section_name, url, d, *, lookback_days=None,
+                       dedup_seen=None, major_terms=None, limit=None):
+    """Turn one parsed feed into item dicts.
+
+    Dedup (via the caller-owned ``dedup_seen`` set) and the major-terms
+    filter run inline here so entries are touched once instead of being
+    re-walked by separate dedup/filter passes afterwards.
+    """
     items = []
-    for url in urls or []:
-        d = fetch_feed(url)
-        if not d or d.bozo:
+    if not d or d.bozo:
+        return items
+    for e in d.entries:
+        title = (e.get("title") or "").strip()
+        link = (e.get("link") or "").strip()
+        if not title or not link:
             continue
-        for e in d.entries:
-            title = (e.get("title") or "").strip()
-            link = (e.get("link") or "").strip()
-            if not title or not link:
+        key = None
+        if dedup_seen is not None:
+            key = (title.lower(), canonical_link(link))
+            if key in dedup_seen:
                 continue
-            published = e.get("published_parsed") or e.get("updated_parsed")
-            if published and not within_lookback(published, days=lookback_days):
+        published = e.get("published_parsed") or e.get("updated_parsed")
+        if published and not within_lookback(published, days=lookback_days):
+            continue
+        # strip before the major gate: matching raw markup lets terms hide
+        # in hrefs ("tax" in /taxonomy/); strip_tags early-stops at the
+        # text cap, so entries dropped below still stay cheap
+        summary = strip_tags(e.get("summary") or e.get("description") or "")
+        if major_terms is not None and not is_major(f"{title} {summary}", major_terms):
+            continue
+        if key is not None:
+            # claim the key only for entries that pass every gate — the set
+            # is shared across sections, and a copy rejected by one bucket's
+            # major gate must not shadow the copy another bucket keeps
+            dedup_seen.add(key)
+        items.append({
+            "title": title,
+            "link": link,
+            "summary": summary,
+            "section": section_name,
+            "source": url,
+            "_text_lc": f" {title} {summary} {link} ".lower(),
+        })
+        if limit and len(items) >= limit:
+            break
+    return items
+
+def collect_rss_items(section_name, urls, *, lookback_days=None,
+                      dedup_seen=None, major_terms=None, limit=None):
+    urls = list(urls or [])
+    if not urls:
+        return []
+    if dedup_seen is None:
+        dedup_seen = set()
+    items = []
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(urls))) as ex:
+        futures = {ex.submit(fetch_feed, u): u for u in urls}
+        for fut in as_completed(futures):
+            try:
+                d = fut.result()
+            except Exception:
                 continue
-            summary = e.get("summary") or e.get("description") or ""
-            items.append({
-                "title": title,
-                "link": link,
-                "summary": strip_tags(summary)[:2500],
-                "section": section_name,
-                "source": url,
-            })
+            items.extend(extract_feed_items(section_name, futures[fut], d,
+                                            lookback_days=lookback_days,
+                                            dedup_seen=dedup_seen,
+                                            major_terms=major_terms,
+                                            limit=limit))
     return items
 
+# Query params that only identify the campaign, not the article — stripping
+# them lets the same story shared via different channels dedup together.
+_TRACKING_PARAMS = ("gclid", "fbclid", "mc_cid", "mc_eid", "ref")
+
+def canonical_link(link):
+    try:
+        p = urlparse(link)
+        query = [(k, v) for k, v in parse_qsl(p.query, keep_blank_values=True)
+                 if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS]
+        return urlunparse((p.scheme.lower(), p.netloc.lower(), p.path, p.params, urlencode(query), ""))
+    except Exception:
+        return link
+
 def dedup_items(items):
-    seen, out = set(), []
+    # dict keyed on the link (title as fallback for link-less items) keeps
+    # first-seen order with one hash per item and no tuple allocation
+    seen = {}
     for it in items:
-        k = (it.get("title","").lower(), it.get("link",""))
-        if k in seen:
-            continue
-        seen.add(k); out.append(it)
-    return out
+        k = it.get("link") or it.get("title", "").lower()
+        if k and k not in seen:
+            seen[k] = it
+    return list(seen.values())
+
+# Automatons are built lazily per terms list (keyed by id, the lists are
+# module/run constants) so each body needs one linear scan instead of one
+# substring search per term.
+_ac_cache = {}
+
+def _get_automaton(terms):
+    auto = _ac_cache.get(id(terms))
+    if auto is None:
+        auto = ahocorasick.Automaton()
+        for t in terms:
+            # verbatim apart from case: several term lists use leading/
+            # trailing spaces as word boundaries (" us ", " uk ") and
+            # stripping them would match inside "bonus" or "ukraine"
+            t = str(t).lower()
+            if t:
+                auto.add_word(t, t)
+        auto.make_automaton()
+        _ac_cache[id(terms)] = auto
+    return auto
+
+def contains_any(body, terms):
+    if not terms:
+        return False
+    if HAS_AHOCORASICK:
+        return next(_get_automaton(terms).iter(body), None) is not None
+    return any(t.lower() in body for t in terms)
+
+def count_present(text, terms, rx=None):
+    """How many of ``terms`` appear in ``text`` (each term counted once).
+
+    One automaton scan when pyahocorasick is available. Otherwise the
+    precompiled alternation only serves as a cheap no-hit reject — its
+    non-overlapping matches would miss nested terms (``uk`` inside
+    ``ukgc``), so actual counting stays per-term.
+    """
+    if not terms:
+        return 0
+    if HAS_AHOCORASICK:
+        return len({v for _, v in _get_automaton(terms).iter(text)})
+    if rx is not None and rx.search(text) is None:
+        return 0
+    return sum(1 for t in terms if t in text)
+
+def _alternation_re(terms):
+    terms = [t for t in (terms or []) if t]
+    if not terms:
+        return None
+    pattern = "|".join(re.escape(t) for t in terms)
+    return re.compile(pattern)
 
 def is_major(body, terms):
-    body = (body or "").lower()
-    return any(t.lower() in body for t in (terms or []))
+    return contains_any((body or "").lower(), terms)
 
 # ---------- UK Focus Scoring ----------
 NON_UK_HINTS = [
@@ -126,7 +597,7 @@ def parse_focus(sources):
             try: out.append(str(x).strip().lower())
             except: pass
         return out
-    return {
+    parsed = {
         "region": str(focus.get("region","")).strip().lower(),
         "keywords": norm_list(focus.get("keywords")),
         "companies": norm_list(focus.get("companies")),
@@ -134,31 +605,70 @@ def parse_focus(sources):
         "source_domains_prefer": norm_list(focus.get("source_domains_prefer")),
         "trend_hints": norm_list(focus.get("trend_hints")),
     }
-
-def host_matches_suffix(link, suffixes):
-    try:
-        host = urlparse(link).netloc.lower()
-        return any(host.endswith(suf) for suf in (suffixes or []))
-    except Exception:
-        return False
-
-def host_in_pref(link, domains):
-    try:
-        host = urlparse(link).netloc.lower()
-        return any(host.endswith(d) for d in (domains or []))
-    except Exception:
-        return False
+    # matching structures built once here, not per scored item;
+    # str.endswith takes a tuple, so suffix checks become one C call
+    parsed["_kw_re"] = _alternation_re(parsed["keywords"])
+    parsed["_co_re"] = _alternation_re(parsed["companies"])
+    parsed["_suffixes_tuple"] = tuple(parsed["suffixes"])
+    parsed["_pref_tuple"] = tuple(parsed["source_domains_prefer"])
+    return parsed
+
+def _item_host(it):
+    """Lowercased netloc of the item link, parsed once and memoized."""
+    h = it.get("_host")
+    if h is None:
+        try:
+            h = urlparse(it.get("link") or "").netloc.lower()
+        except Exception:
+            h = ""
+        it["_host"] = h
+    return h
+
+def _host_ends(host, suffixes):
+    """``suffixes`` must be a tuple (see parse_focus)."""
+    return bool(suffixes) and host.endswith(suffixes)
+
+def _item_text_lc(it):
+    """Lowercased title+summary+link, computed once per item and memoized."""
+    txt = it.get("_text_lc")
+    if txt is None:
+        txt = f" {(it.get('title') or '')} {(it.get('summary') or '')} {(it.get('link') or '')} ".lower()
+        it["_text_lc"] = txt
+    return txt
+
+def _item_ts_lc(it):
+    """Lowercased title+summary only — the major gate must not see the
+    link, where terms hide in URL paths ("tax" in /taxonomy/)."""
+    txt = it.get("_ts_lc")
+    if txt is None:
+        txt = f" {(it.get('title') or '')} {(it.get('summary') or '')} ".lower()
+        it["_ts_lc"] = txt
+    return txt
+
+def _title_html(it):
+    """html.escape'd title, computed once per item and memoized."""
+    h = it.get("_title_html")
+    if h is None:
+        h = it["_title_html"] = html.escape((it.get("title") or "").strip())
+    return h
+
+def _link_html(it):
+    h = it.get("_link_html")
+    if h is None:
+        h = it["_link_html"] = html.escape(it.get("link") or "#")
+    return h
 
 def score_focus(it, focus):
     if not focus:
         return 0
-    txt = f" {(it.get('title') or '')} {(it.get('summary') or '')} {(it.get('link') or '')} ".lower()
+    txt = _item_text_lc(it)
     score = 0
-    if host_matches_suffix(it.get("link",""), focus["suffixes"]): score += 2
-    if host_in_pref(it.get("link",""), focus.get("source_domains_prefer") or []): score += 3
-    score += sum(1 for k in (focus["keywords"] or []) if k in txt)
-    score += 2 * sum(1 for c in (focus["companies"] or []) if c in txt)
-    if any(h in txt for h in NON_UK_HINTS): score -= 2
+    host = _item_host(it)
+    if _host_ends(host, focus["_suffixes_tuple"]): score += 2
+    if _host_ends(host, focus["_pref_tuple"]): score += 3
+    score += count_present(txt, focus["keywords"], focus.get("_kw_re"))
+    score += 2 * count_present(txt, focus["companies"], focus.get("_co_re"))
+    if contains_any(txt, NON_UK_HINTS): score -= 2
     return score
 
 def apply_focus_filter(items, focus, major_terms):
@@ -166,78 +676,286 @@ def apply_focus_filter(items, focus, major_terms):
         return items
     kept = []
     for it in items:
-        s = score_focus(it, focus)
-        if s >= FOCUS_THRESHOLD or is_major(f"{it['title']} {it['summary']}", major_terms):
+        if score_focus(it, focus) >= FOCUS_THRESHOLD or contains_any(_item_ts_lc(it), major_terms or []):
             kept.append(it)
     return kept
 
 # ---------- OpenAI helpers ----------
-def _llm_json(prompt, tries=2, temperature=0.2, system="You are a precise iGaming reporter. Be concise. No inventions."):
+def _llm_json(prompt, tries=2, temperature=0.2, system="You are a precise iGaming reporter. Be concise. No inventions.", max_tokens=None, model=MODEL):
+    cache_key = _llm_cache_key(model, system, prompt, temperature)
+    hit = _llm_cache_get(cache_key)
+    if hit is not None:
+        return hit
     last = None
     for _ in range(tries):
         try:
             r = client.chat.completions.create(
-                model=MODEL,
+                model=model,
                 response_format={"type": "json_object"},
                 messages=[{"role": "system", "content": system},
                           {"role": "user", "content": prompt}],
                 temperature=temperature,
+                top_p=1,
+                max_tokens=max_tokens,
             )
-            return json.loads(r.choices[0].message.content.strip())
+            data = _json_loads(r.choices[0].message.content.strip())
+            _llm_cache_set(cache_key, data)
+            return data
         except Exception as e:
             last = e
             time.sleep(0.8)
             try:
                 r = client.chat.completions.create(
-                    model=MODEL,
+                    model=model,
                     messages=[{"role": "system", "content": system},
                               {"role": "user", "content": prompt}],
                     temperature=temperature,
+                    top_p=1,
+                    max_tokens=max_tokens,
                 )
-                return json.loads(r.choices[0].message.content.strip())
+                data = _json_loads(r.choices[0].message.content.strip())
+                _llm_cache_set(cache_key, data)
+                return data
             except Exception as e2:
                 last = e2
                 time.sleep(0.8)
     raise last
 
+async def _allm_json(prompt, tries=2, temperature=0.2, system="You are a precise iGaming reporter. Be concise. No inventions.", max_tokens=None, model=MODEL):
+    cache_key = _llm_cache_key(model, system, prompt, temperature)
+    hit = _llm_cache_get(cache_key)
+    if hit is not None:
+        return hit
+    last = None
+    for _ in range(tries):
+        try:
+            await _openai_limiter.wait()
+            raw = await aclient.chat.completions.with_raw_response.create(
+                model=model,
+                response_format={"type": "json_object"},
+                messages=[{"role": "system", "content": system},
+                          {"role": "user", "content": prompt}],
+                temperature=temperature,
+                top_p=1,
+                max_tokens=max_tokens,
+            )
+            _openai_limiter.update(raw.headers)
+            r = raw.parse()
+            data = _json_loads(r.choices[0].message.content.strip())
+            _llm_cache_set(cache_key, data)
+            return data
+        except Exception as e:
+            last = e
+            await asyncio.sleep(0.8)
+            try:
+                await _openai_limiter.wait()
+                raw = await aclient.chat.completions.with_raw_response.create(
+                    model=model,
+                    messages=[{"role": "system", "content": system},
+                              {"role": "user", "content": prompt}],
+                    temperature=temperature,
+                    top_p=1,
+                    max_tokens=max_tokens,
+                )
+                _openai_limiter.update(raw.headers)
+                r = raw.parse()
+                data = _json_loads(r.choices[0].message.content.strip())
+                _llm_cache_set(cache_key, data)
+                return data
+            except Exception as e2:
+                last = e2
+                await asyncio.sleep(0.8)
+    raise last
+
+# ---------- Adaptive rate limiting (replaces fixed sleeps) ----------
+_RESET_RE = re.compile(r"(?:(\d+)h)?(?:(\d+)m)?(?:([\d.]+)s)?(?:(\d+)ms)?$")
+
+def _parse_reset(val):
+    """Parse OpenAI's x-ratelimit-reset-* durations, e.g. '6m12s' or '120ms'."""
+    m = _RESET_RE.match((val or "").strip())
+    if not m or not any(m.groups()):
+        return 1.0
+    hours, mins, secs, ms = m.groups()
+    return int(hours or 0) * 3600 + int(mins or 0) * 60 + float(secs or 0) + int(ms or 0) / 1000.0
+
+class HeaderRateLimiter:
+    """Pace requests from x-ratelimit response headers.
+
+    Instead of a blanket sleep between calls, only wait when the provider
+    reports the request quota as nearly exhausted, until the advertised
+    reset time.
+    """
+    def __init__(self, min_remaining=2):
+        self.min_remaining = min_remaining
+        self.remaining = None
+        self.reset_at = 0.0
+
+    async def wait(self):
+        if self.remaining is not None and self.remaining < self.min_remaining:
+            delay = self.reset_at - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(min(delay, 30.0))
+            self.remaining = None
+
+    def update(self, headers):
+        try:
+            rem = headers.get("x-ratelimit-remaining-requests")
+            if rem is not None:
+                self.remaining = int(rem)
+            reset = headers.get("x-ratelimit-reset-requests")
+            if reset:
+                self.reset_at = time.monotonic() + _parse_reset(reset)
+        except Exception:
+            pass
+
+_openai_limiter = HeaderRateLimiter()
+
+# Bilingual 2-sentence cards fit comfortably in ~220 completion tokens;
+# capping stops the model padding and shortens generation wall time.
+CARD_MAX_TOKENS = int(os.getenv("CARD_MAX_TOKENS", "220"))
+
+
 # ---------- Podcasts (ListenNotes) ----------
 LISTENNOTES_BASE = "https://listen-api.listennotes.com/api/v2/search"
 
+def _listennotes_params(q, since):
+    return {"q": q, "type": "episode", "sort_by_date": 1, "published_after": since, "safe_mode": 0, "len_min": 5}
+
+def _listennotes_extract(data):
+    items = []
+    for ep in data.get("results", []):
+        title = ep.get("title_original") or ep.get("title") or ""
+        link  = ep.get("listennotes_url") or ep.get("link") or ep.get("audio") or ""
+        desc  = strip_tags(ep.get("description_original") or ep.get("description") or "")
+        if not title or not link:
+            continue
+        title, link, desc = title.strip(), link.strip(), desc.strip()
+        items.append({
+            "title": title,
+            "link": link,
+            "summary": desc,
+            "section": "podcasts_listennotes",
+            "source": "ListenNotes",
+            "_text_lc": f" {title} {desc} {link} ".lower(),
+        })
+    return items
+
+def _listennotes_query(q, headers, since):
+    try:
+        r = _SESSION.get(LISTENNOTES_BASE, headers=headers, params=_listennotes_params(q, since), timeout=20)
+        if r.status_code != 200:
+            return []
+        return _listennotes_extract(_json_loads(r.content))
+    except Exception:
+        return []
+
+async def _listennotes_gather(queries, headers, since):
+    # all queries hit the same host: with HTTP/2 they multiplex on one socket
+    try:
+        client_ = httpx.AsyncClient(http2=True, timeout=20, headers=headers)
+    except Exception:  # h2 not installed
+        client_ = httpx.AsyncClient(timeout=20, headers=headers)
+    items = []
+    async with client_ as c:
+        async def one(q):
+            try:
+                r = await c.get(LISTENNOTES_BASE, params=_listennotes_params(q, since))
+                if r.status_code == 429:
+                    # back off for the advertised window, then retry once
+                    try:
+                        delay = float(r.headers.get("Retry-After", "1"))
+                    except ValueError:
+                        delay = 1.0
+                    await asyncio.sleep(min(delay, 10.0))
+                    r = await c.get(LISTENNOTES_BASE, params=_listennotes_params(q, since))
+                if r.status_code != 200:
+                    return []
+                return _listennotes_extract(_json_loads(r.content))
+            except Exception:
+                return []
+        for batch in await asyncio.gather(*(one(q) for q in queries)):
+            items.extend(batch)
+    return items
+
 def collect_listennotes_items(queries, major_terms, focus):
     if not LISTENNOTES_API_KEY or not queries:
         return []
-    items = []
     headers = {"X-ListenAPI-Key": LISTENNOTES_API_KEY}
     since = int((datetime.datetime.utcnow() - datetime.timedelta(days=LOOKBACK_DAYS)).timestamp())
-    for q in (queries or []):
-        params = {"q": q, "type": "episode", "sort_by_date": 1, "published_after": since, "safe_mode": 0, "len_min": 5}
-        try:
-            r = requests.get(LISTENNOTES_BASE, headers=headers, params=params, timeout=20)
-            if r.status_code != 200:
-                continue
-            data = r.json()
-            for ep in data.get("results", []):
-                title = ep.get("title_original") or ep.get("title") or ""
-                link  = ep.get("listennotes_url") or ep.get("link") or ep.get("audio") or ""
-                desc  = strip_tags(ep.get("description_original") or ep.get("description") or "")
-                if not title or not link:
-                    continue
-                items.append({
-                    "title": title.strip(),
-                    "link": link.strip(),
-                    "summary": (desc.strip()[:2500]),
-                    "section": "podcasts_listennotes",
-                    "source": "ListenNotes",
-                })
-        except Exception:
-            pass
-        time.sleep(0.35)
+    if HAS_HTTPX:
+        items = asyncio.run(_listennotes_gather(queries, headers, since))
+    else:
+        items = []
+        with ThreadPoolExecutor(max_workers=min(4, len(queries))) as ex:
+            for batch in ex.map(lambda q: _listennotes_query(q, headers, since), queries):
+                items.extend(batch)
     items = dedup_items(items)
     if MAJOR_ONLY_NON_CASINO:
-        items = [it for it in items if is_major(f"{it['title']} {it['summary']}", major_terms)]
+        items = [it for it in items if contains_any(_item_ts_lc(it), major_terms or [])]
     items = apply_focus_filter(items, focus, major_terms)
     return items[:MAX_ITEMS_PER_SECTION] if MAX_ITEMS_PER_SECTION > 0 else items
 
+# ---------- Near-duplicate collapsing (embeddings) ----------
+EMBED_MODEL = os.getenv("OPENAI_EMBED_MODEL", "text-embedding-3-small")
+NEAR_DUP_THRESHOLD = float(os.getenv("NEAR_DUP_THRESHOLD", "0.9"))
+
+def _pairwise_cosine(vecs):
+    """All-pairs cosine similarity for L2-normalizable vectors."""
+    if HAS_NUMPY:
+        m = np.asarray(vecs, dtype=np.float32)
+        norms = np.linalg.norm(m, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        m = m / norms
+        return (m @ m.T).tolist()
+    import math
+    normed = []
+    for v in vecs:
+        n = math.sqrt(sum(x * x for x in v)) or 1.0
+        normed.append([x / n for x in v])
+    return [[sum(a * b for a, b in zip(u, w)) for w in normed] for u in normed]
+
+def collapse_near_duplicates(items, threshold=None):
+    """Collapse semantically near-identical items into one representative.
+
+    Two outlets covering the same press release produce two LLM calls and
+    two cards; one cheap batch embedding call plus union-find at cosine >=
+    threshold keeps only the longest-summary item per cluster.
+    """
+    if len(items) < 2:
+        return items
+    threshold = threshold or NEAR_DUP_THRESHOLD
+    try:
+        resp = client.embeddings.create(
+            model=EMBED_MODEL,
+            input=[f"{it.get('title','')} {(it.get('summary') or '')[:500]}" for it in items],
+        )
+        vecs = [d.embedding for d in resp.data]
+    except Exception:
+        return items  # embeddings unavailable: keep everything
+
+    sims = _pairwise_cosine(vecs)
+    parent = list(range(len(items)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    for i in range(len(items)):
+        for j in range(i + 1, len(items)):
+            if sims[i][j] >= threshold:
+                parent[find(i)] = find(j)
+
+    best = {}
+    for i, it in enumerate(items):
+        root = find(i)
+        cur = best.get(root)
+        if cur is None or len(it.get("summary") or "") > len(items[cur].get("summary") or ""):
+            best[root] = i
+    keep = set(best.values())
+    return [it for i, it in enumerate(items) if i in keep]
+
 # ---------- Manual must-include (direct URLs, e.g., EGR tax) ----------
 OG_TITLE_RE = re.compile(r'<meta[^>]+property=["\']og:title["\'][^>]+content=["\']([^"\']+)["\']', re.I)
 OG_DESC_RE  = re.compile(r'<meta[^>]+property=["\']og:description["\'][^>]+content=["\']([^"\']+)["\']', re.I)
@@ -247,140 +965,311 @@ META_DESC_RE= re.compile(r'<meta[^>]+name=["\']description["\'][^>]+content=["\'
 def fetch_url_metadata(url, timeout=20):
     title = ""; desc = ""
     try:
-        r = requests.get(url, timeout=timeout, headers={"User-Agent":"Mozilla/5.0"})
+        r = _SESSION.get(url, timeout=timeout, stream=True,
+                         headers={"User-Agent":"Mozilla/5.0"})
         if r.status_code >= 400:
+            r.close()
             return None
-        html_txt = r.text or ""
-        m = OG_TITLE_RE.search(html_txt) or TITLE_RE.search(html_txt)
-        if m: title = strip_tags(m.group(1)).strip()
-        m2 = OG_DESC_RE.search(html_txt) or META_DESC_RE.search(html_txt)
-        if m2: desc = strip_tags(m2.group(1)).strip()
+        # the OG/meta tags live in <head>; read at most 64 KB instead of
+        # pulling whole editorial pages that can run to megabytes
+        buf = b""
+        try:
+            for chunk in r.iter_content(8192):
+                buf += chunk
+                if len(buf) >= 65536 or b"</head" in buf:
+                    break
+        finally:
+            r.close()
+        html_txt = buf.decode(r.encoding or "utf-8", errors="replace")
+        parsed = False
+        if HAS_LXML and html_txt:
+            # one C-backed parse replaces four full-page regex scans
+            try:
+                tree = _lxml_html.fromstring(html_txt)
+                t = (tree.xpath('//meta[@property="og:title"]/@content')
+                     or tree.xpath('//title/text()'))
+                d = (tree.xpath('//meta[@property="og:description"]/@content')
+                     or tree.xpath('//meta[@name="description"]/@content'))
+                title = (t[0] if t else "").strip()
+                desc = (d[0] if d else "").strip()
+                parsed = True
+            except Exception:
+                parsed = False
+        if not parsed:
+            m = OG_TITLE_RE.search(html_txt) or TITLE_RE.search(html_txt)
+            if m: title = strip_tags(m.group(1)).strip()
+            m2 = OG_DESC_RE.search(html_txt) or META_DESC_RE.search(html_txt)
+            if m2: desc = strip_tags(m2.group(1)).strip()
         if not title: title = url
         return {"title": title, "summary": desc or "", "link": url}
     except Exception:
         return None
 
 def inject_must_include(urls):
+    urls = list(urls or [])
+    if not urls:
+        return []
+    # independent editorial pages: fetch them concurrently like the feeds
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(urls))) as ex:
+        metas = list(ex.map(fetch_url_metadata, urls))
     out = []
-    for u in (urls or []):
-        meta = fetch_url_metadata(u)
+    for u, meta in zip(urls, metas):
         if not meta:
             out.append({"title": u, "summary": "", "link": u, "section": "news_rss", "source": "manual"})
         else:
             meta.update({"section":"news_rss","source":"manual"})
             out.append(meta)
-        time.sleep(0.3)
     return out
 
+# ---------- HTML templates ----------
+# Style strings are written once here; each card/block is a single .format
+# call instead of rebuilding the CSS-laden literals per item.
+_SECTION_HEADER_TMPL = (
+    '<div style="font-size:18px;font-weight:800;margin:24px 0 8px;'
+    'padding-bottom:6px;border-bottom:1px solid #eceff3;color:#111827;">{title}</div>'
+)
+_NEWS_CARD_TMPL = (
+    '<div style="border:1px solid #e6e8eb;border-radius:12px;background:#ffffff;'
+    'box-shadow:0 1px 3px rgba(0,0,0,0.05);padding:16px;margin:12px 0;">'
+    '<div style="font-size:16px;font-weight:700;margin:0 0 8px;">{title}</div>'
+    '<p style="margin:0 0 6px;line-height:1.5;font-size:14px;color:#1f2937;">{en}</p>'
+    '{he_block}'
+    '<a href="{link}" target="_blank" '
+    'style="display:inline-block;padding:8px 12px;border-radius:8px;'
+    'background:#0b5fff;color:#ffffff;text-decoration:none;'
+    'font-weight:600;font-size:13px;">Open source</a>'
+    '</div>'
+)
+_NEWS_HE_TMPL = '<p dir="rtl" style="margin:0 12px 10px 0;line-height:1.6;font-size:14px;color:#111827;">{he}</p>'
+_GAME_CARD_TMPL = (
+    '<div style="border:1px solid #e6e8eb;border-radius:12px;background:#ffffff;'
+    'box-shadow:0 1px 3px rgba(0,0,0,0.05);padding:14px;margin:10px 0;">'
+    '<div style="font-size:15px;font-weight:700;margin:0 0 6px;">{title}</div>'
+    '<p style="margin:0 0 6px;line-height:1.5;font-size:13.5px;color:#1f2937;">{en}</p>'
+    '{he_block}'
+    '<a href="{link}" target="_blank" style="display:inline-block;padding:7px 10px;border-radius:8px;'
+    'background:#0369a1;color:#ffffff;text-decoration:none;font-weight:600;font-size:12.5px;">Open source</a>'
+    '</div>'
+)
+_GAME_HE_TMPL = '<p dir="rtl" style="margin:0 12px 8px 0;line-height:1.6;font-size:13.5px;color:#111827;">{he}</p>'
+_TREND_BLOCK_TMPL = (
+    '<div style="border:1px dashed #d7dbe2;border-radius:12px;background:#fbfcff;padding:14px 16px;margin:10px 0;">'
+    '<div style="font-weight:700;font-size:15px;color:#0b1220;margin-bottom:4px;">📈 {title_en}</div>'
+    '<div style="font-size:13px;color:#1f2937;margin-bottom:6px;">{desc_en}</div>'
+    '<div dir="rtl" style="font-weight:700;font-size:14px;color:#0b1220;margin:6px 0 2px;">{title_he}</div>'
+    '<div dir="rtl" style="font-size:13px;color:#111827;">{desc_he}</div>'
+    '</div>'
+)
+
 # ---------- Summaries (cards) ----------
-def summarize_cards(items, title_text):
-    if not items:
-        return ""
-    def llm_two_paras(it):
-        prompt_json = (
-            "Write one concise paragraph in English (max 2 sentences) and one in Hebrew (max 2). "
-            'Return ONLY JSON: {"en":"...","he":"..."}\n\n'
-            f"Title: {it['title']}\nSource URL: {it['link']}\nFeed Summary: {it['summary']}"
-        )
+# One C-level pass for escaping LLM paragraph text (html.escape + newline->br
+# would walk the string twice); titles/links keep html.escape for attributes.
+_HTML_TRANS = str.maketrans({
+    "&": "&amp;", "<": "&lt;", ">": "&gt;",
+    '"': "&quot;", "'": "&#x27;", "\n": "<br>",
+})
+
+# Invariant instruction blocks live in module constants and are sent as the
+# leading system message, byte-identical on every call, so the provider's
+# automatic prompt cache can reuse the prefix across items and runs.
+CARD_SYSTEM_PROMPT = (
+    "You are a precise iGaming reporter. Be concise. No inventions. "
+    "Write one concise paragraph in English (max 2 sentences) and one in Hebrew (max 2). "
+    'Return ONLY JSON: {"en":"...","he":"..."}'
+)
+CARD_BATCH_SYSTEM_PROMPT = (
+    "You are a precise iGaming reporter. Be concise. No inventions. "
+    "For EVERY item in the JSON list you receive, write one concise English paragraph "
+    "(max 2 sentences) and one concise Hebrew paragraph (max 2 sentences). "
+    'Return ONLY JSON: {"summaries":[{"i":0,"en":"...","he":"..."}, ...]} with one entry per input index.'
+)
+
+_CARD_TRANSLATE_PROMPT = (
+    "Translate the following news blurb to concise Hebrew (max 2 sentences). "
+    'Return ONLY JSON: {"he":"..."}\n\n'
+)
+
+def _publisher_summary_ok(it):
+    """True when the feed's own blurb is already a clean 1-3 sentence summary."""
+    s = " ".join((it.get("summary") or "").split())
+    return 40 <= len(s) <= 280 and "." in s
+
+async def llm_two_paras(it):
+    cached = summary_cache_get(it)
+    if cached:
+        return cached
+    if _publisher_summary_ok(it):
+        # use the publisher's blurb as the English half; only the Hebrew
+        # translation needs the model (roughly half the tokens per card)
+        en = " ".join(it["summary"].split())
         try:
-            data = _llm_json(prompt_json)
-            en = (data.get("en") or "").strip()
+            data = await _allm_json(_CARD_TRANSLATE_PROMPT + en, max_tokens=CARD_MAX_TOKENS, model=SUMMARY_MODEL)
             he = (data.get("he") or "").strip()
-            if en or he:
+            if he:
+                summary_cache_set(it, (en, he))
                 return en, he
         except Exception:
             pass
-        prompt_delim = (
-            "Two concise paragraphs: first English (max 2 sentences), second Hebrew (max 2). "
-            "Separate with a single line: ---\n\n"
-            f"Title: {it['title']}\nSource URL: {it['link']}\nFeed Summary: {it['summary']}"
+    prompt_json = f"Title: {it['title']}\nSource URL: {it['link']}\nFeed Summary: {it['summary']}"
+    try:
+        data = await _allm_json(prompt_json, system=CARD_SYSTEM_PROMPT, max_tokens=CARD_MAX_TOKENS, model=SUMMARY_MODEL)
+        en = (data.get("en") or "").strip()
+        he = (data.get("he") or "").strip()
+        if not (10 <= len(en) <= 600):
+            # cascade: mini output failed the sanity check, re-issue once
+            # on the top-tier model
+            data = await _allm_json(prompt_json, system=CARD_SYSTEM_PROMPT,
+                                    max_tokens=CARD_MAX_TOKENS, model=MODEL)
+            en = (data.get("en") or "").strip()
+            he = (data.get("he") or "").strip()
+        if en or he:
+            summary_cache_set(it, (en, he))
+            return en, he
+    except Exception:
+        pass
+    prompt_delim = (
+        "Two concise paragraphs: first English (max 2 sentences), second Hebrew (max 2). "
+        "Separate with a single line: ---\n\n"
+        f"Title: {it['title']}\nSource URL: {it['link']}\nFeed Summary: {it['summary']}"
+    )
+    try:
+        r = await aclient.chat.completions.create(
+            model=SUMMARY_MODEL, temperature=0.2,
+            messages=[{"role":"system","content":"Be factual and concise."},
+                      {"role":"user","content":prompt_delim}]
         )
-        try:
-            r = client.chat.completions.create(
-                model=MODEL, temperature=0.2,
-                messages=[{"role":"system","content":"Be factual and concise."},
-                          {"role":"user","content":prompt_delim}]
-            )
-            text = r.choices[0].message.content.strip()
-            parts = text.split("\n---\n", 1)
-            en = parts[0].strip()
-            he = parts[1].strip() if len(parts) > 1 else ""
+        text = r.choices[0].message.content.strip()
+        parts = text.split("\n---\n", 1)
+        en = parts[0].strip()
+        he = parts[1].strip() if len(parts) > 1 else ""
+        if en or he:
+            summary_cache_set(it, (en, he))
+            return en, he
+    except Exception:
+        pass
+    snippet = " ".join(((it.get("summary") or it.get("title") or "")).split())[:300]
+    return (snippet or "See source."), ""
+
+SUMMARY_BATCH_SIZE = int(os.getenv("SUMMARY_BATCH_SIZE", "8"))
+
+async def _summarize_chunk(chunk):
+    """Summarize a chunk of items with ONE structured request; per-item fallback for gaps."""
+    out = [None] * len(chunk)
+    payload = [{"i": i, "title": it["title"], "link": it["link"], "summary": it["summary"]}
+               for i, it in enumerate(chunk)]
+    prompt = _json_dumps(payload)
+    try:
+        data = await _allm_json(prompt, system=CARD_BATCH_SYSTEM_PROMPT,
+                                max_tokens=CARD_MAX_TOKENS * len(chunk), model=SUMMARY_MODEL)
+        for row in (data.get("summaries") or []):
+            try:
+                i = int(row.get("i"))
+            except Exception:
+                continue
+            if not (0 <= i < len(chunk)) or out[i] is not None:
+                continue
+            en = (row.get("en") or "").strip()
+            he = (row.get("he") or "").strip()
             if en or he:
-                return en, he
-        except Exception:
-            pass
-        snippet = " ".join(((it.get("summary") or it.get("title") or "")).split())[:300]
-        return (snippet or "See source."), ""
+                out[i] = (en, he)
+                summary_cache_set(chunk[i], (en, he))
+    except Exception:
+        pass
+    gaps = [i for i, v in enumerate(out) if v is None]
+    if gaps:
+        fills = await asyncio.gather(*(llm_two_paras(chunk[i]) for i in gaps))
+        for i, v in zip(gaps, fills):
+            out[i] = v
+    return out
 
-    cards = []
-    for it in items:
-        en, he = llm_two_paras(it)
-        safe_title = html.escape(it["title"])
-        safe_link  = html.escape(it["link"])
-        safe_en    = html.escape(en)
-        safe_he    = html.escape(he)
-        card = (
-            '<div style="border:1px solid #e6e8eb;border-radius:12px;background:#ffffff;'
-            'box-shadow:0 1px 3px rgba(0,0,0,0.05);padding:16px;margin:12px 0;">'
-            f'<div style="font-size:16px;font-weight:700;margin:0 0 8px;">{safe_title}</div>'
-            f'<p style="margin:0 0 6px;line-height:1.5;font-size:14px;color:#1f2937;">{safe_en}</p>'
-        )
-        if safe_he:
-            card += f'<p dir="rtl" style="margin:0 12px 10px 0;line-height:1.6;font-size:14px;color:#111827;">{safe_he}</p>'
-        card += (
-            f'<a href="{safe_link}" target="_blank" '
-            'style="display:inline-block;padding:8px 12px;border-radius:8px;'
-            'background:#0b5fff;color:#ffffff;text-decoration:none;'
-            'font-weight:600;font-size:13px;">Open source</a>'
-            '</div>'
-        )
-        cards.append(card)
+def summarize_items(items):
+    """Return an (en, he) pair per item, batching LLM calls and honoring the cache."""
+    results = [None] * len(items)
+    pending = []
+    for i, it in enumerate(items):
+        hit = summary_cache_get(it)
+        if hit:
+            results[i] = hit
+        else:
+            pending.append(i)
+    if not pending:
+        return results
+    # items with a usable publisher blurb skip the batch prompt and take the
+    # translate-only path inside llm_two_paras; the rest go out in chunks.
+    # Both phases share ONE event loop — a second asyncio.run would reuse
+    # the async client's keep-alive connections from the first, closed loop
+    # and every call would fail into the snippet fallbacks.
+    direct = [i for i in pending if _publisher_summary_ok(items[i])]
+    direct_set = set(direct)
+    batched = [i for i in pending if i not in direct_set]
+    chunks = [batched[p:p + SUMMARY_BATCH_SIZE] for p in range(0, len(batched), SUMMARY_BATCH_SIZE)]
+
+    async def _driver():
+        sem = asyncio.Semaphore(LLM_CONCURRENCY)
+        async def _one(i):
+            async with sem:
+                results[i] = await llm_two_paras(items[i])
+        async def _chunk(idxs):
+            async with sem:
+                got = await _summarize_chunk([items[i] for i in idxs])
+            for i, v in zip(idxs, got):
+                results[i] = v
+        await asyncio.gather(*[_one(i) for i in direct],
+                             *[_chunk(c) for c in chunks])
+
+    asyncio.run(_driver())
+    return results
 
-    header = (
-        f'<div style="font-size:18px;font-weight:800;margin:24px 0 8px;'
-        'padding-bottom:6px;border-bottom:1px solid #eceff3;color:#111827;">'
-        f'{html.escape(title_text)}</div>'
-    )
+def summarize_cards(items, title_text):
+    if not items:
+        return ""
+    results = summarize_items(items)
+
+    cards = []
+    for it, (en, he) in zip(items, results):
+        safe_title = _title_html(it)
+        safe_link  = _link_html(it)
+        safe_en    = (en or "").translate(_HTML_TRANS)
+        safe_he    = (he or "").translate(_HTML_TRANS)
+        cards.append(_NEWS_CARD_TMPL.format(
+            title=safe_title,
+            en=safe_en,
+            he_block=(_NEWS_HE_TMPL.format(he=safe_he) if safe_he else ""),
+            link=safe_link,
+        ))
+
+    header = _SECTION_HEADER_TMPL.format(title=html.escape(title_text))
     return header + "".join(cards)
 
 # ---------- Trends (3, macro) ----------
-STOP = set("the a an and or for of to in on with by from as at is are was were be been being it this that these those not no".split())
+STOP = frozenset("the a an and or for of to in on with by from as at is are was were be been being it this that these those not no".split())
+
+_TOK_RE = re.compile(r"[^a-zA-Z0-9 £]")
 
 def _tokens(s):
-    s = re.sub(r"[^a-zA-Z0-9 £]", " ", s or "")
-    return [w.lower() for w in s.split() if len(w) > 2 and w.lower() not in STOP]
+    s = _TOK_RE.sub(" ", s or "").lower()
+    return [w for w in s.split() if len(w) > 2 and w not in STOP]
 
 def build_trends_section(collected, focus):
-    # only aggregate dict items (skip meta like _games_fallback_urls)
-    pool = []
+    # one pass over the items: stream tokens into the counter and collect
+    # titles as we go (skip meta entries like _games_fallback_urls)
+    counts = Counter()
+    titles = []
     for sec, arr in (collected or {}).items():
-        if sec.startswith("_"):
-            continue
-        if not isinstance(arr, list):
+        if sec.startswith("_") or not isinstance(arr, list):
             continue
         for it in arr:
             if not isinstance(it, dict):
                 continue
-            pool.append(f"{it.get('title','') or ''} {it.get('summary','') or ''}")
+            counts.update(_tokens(f"{it.get('title','') or ''} {it.get('summary','') or ''}"))
+            t = it.get("title", "")
+            if t:
+                titles.append(t)
 
-    if not pool:
+    if not counts and not titles:
         return ""
 
-    toks = []
-    for p in pool:
-        toks.extend(_tokens(p))
-    counts = Counter(toks)
     top_terms = [w for w, _ in counts.most_common(60)]
-
-    titles = []
-    for sec, arr in (collected or {}).items():
-        if sec.startswith("_") or not isinstance(arr, list):
-            continue
-        for it in arr:
-            if isinstance(it, dict):
-                t = it.get("title", "")
-                if t:
-                    titles.append(t)
     titles = titles[:40]
     context = "\n".join(f"- {t}" for t in titles)
 
@@ -395,12 +1284,25 @@ def build_trends_section(collected, focus):
         f"HINTS: {hints}\nTOP TERMS: {', '.join(top_terms)}\n\nRECENT TITLES:\n{context}"
     )
 
-    trends = []
-    try:
+    # content-addressed: same headline pool + hints -> same synthesis
+    trends_key = "trends|" + MODEL + "|" + hashlib.sha256(
+        ("|".join(sorted(titles)) + "#" + hints).encode("utf-8")).hexdigest()
+    def _compute_trends():
         data = _llm_json(prompt, temperature=0.1, system="Be precise, non-speculative. No hallucinations.")
-        trends = (data.get("trends") or [])[:TRENDS_TARGET]
-    except Exception:
-        trends = []
+        t = (data.get("trends") or [])[:TRENDS_TARGET]
+        if t:
+            section_cache_set(trends_key, t)
+        return t
+
+    trends, stale = section_cache_get(trends_key)
+    if trends and stale:
+        # serve the stale synthesis now, refresh it for the next run
+        _swr_refresh.submit(_compute_trends)
+    elif not trends:
+        try:
+            trends = _compute_trends()
+        except Exception:
+            trends = []
 
     if not trends:
         return ""
@@ -411,19 +1313,8 @@ def build_trends_section(collected, focus):
         de = html.escape((t.get("desc_en") or "").strip())
         th = html.escape((t.get("title_he") or "מגמה").strip())
         dh = html.escape((t.get("desc_he") or "").strip())
-        blocks.append(
-            '<div style="border:1px dashed #d7dbe2;border-radius:12px;background:#fbfcff;padding:14px 16px;margin:10px 0;">'
-            f'<div style="font-weight:700;font-size:15px;color:#0b1220;margin-bottom:4px;">📈 {te}</div>'
-            f'<div style="font-size:13px;color:#1f2937;margin-bottom:6px;">{de}</div>'
-            f'<div dir="rtl" style="font-weight:700;font-size:14px;color:#0b1220;margin:6px 0 2px;">{th}</div>'
-            f'<div dir="rtl" style="font-size:13px;color:#111827;">{dh}</div>'
-            '</div>'
-        )
-    header = (
-        '<div style="font-size:18px;font-weight:800;margin:24px 0 8px;'
-        'padding-bottom:6px;border-bottom:1px solid #eceff3;color:#111827;">'
-        '📈 Trends — 3 Most Notable</div>'
-    )
+        blocks.append(_TREND_BLOCK_TMPL.format(title_en=te, desc_en=de, title_he=th, desc_he=dh))
+    header = _SECTION_HEADER_TMPL.format(title="📈 Trends — 3 Most Notable")
     return header + "".join(blocks)
 
 # ---------- Games (5) ----------
@@ -441,31 +1332,43 @@ STUDIO_KEYWORDS = [
 ]
 
 def is_game_item(it: dict) -> bool:
-    t = f" {it.get('title','')} {it.get('summary','')} ".lower()
-    return any(k in t for k in GAME_KEYWORDS) or any(s in t for s in STUDIO_KEYWORDS)
+    t = _item_text_lc(it)
+    return contains_any(t, GAME_KEYWORDS) or contains_any(t, STUDIO_KEYWORDS)
+
+# scoring term groups — module-level so contains_any reuses one cached
+# automaton per group across all items
+_UK_TERMS = [" uk ", "britain", "united kingdom", "england"]
+_LAUNCH_TERMS = ["launch", "released", "unveils"]
+_GAME_FEATURE_TERMS = ["megaways", "jackpot", "game show"]
 
 def _game_score(it, focus):
-    t = f" {it.get('title','')} {it.get('summary','')} {it.get('link','')} ".lower()
+    t = _item_text_lc(it)
     s = 0
-    if any(k in t for k in GAME_KEYWORDS): s += 2
-    if any(sv in t for sv in STUDIO_KEYWORDS): s += 2
+    if contains_any(t, GAME_KEYWORDS): s += 2
+    if contains_any(t, STUDIO_KEYWORDS): s += 2
     if ".co.uk" in t or t.strip().endswith(".uk"): s += 2
-    if " uk " in t or "britain" in t or "united kingdom" in t or "england" in t: s += 2
-    if "launch" in t or "released" in t or "unveils" in t: s += 1
-    if "megaways" in t or "jackpot" in t or "game show" in t: s += 1
+    if contains_any(t, _UK_TERMS): s += 2
+    if contains_any(t, _LAUNCH_TERMS): s += 1
+    if contains_any(t, _GAME_FEATURE_TERMS): s += 1
     s += max(0, score_focus(it, focus))
-    if any(h in t for h in NON_UK_HINTS): s -= 2
+    if contains_any(t, NON_UK_HINTS): s -= 2
     return s
 
+_WS_RE = re.compile(r"\s+")
+
 def _norm_title(s: str) -> str:
-    s = (s or "").lower().strip()
-    s = re.sub(r"\s+", " ", s)
-    return s
+    return _WS_RE.sub(" ", (s or "").lower().strip())
 
 def _is_title_similar(a: str, b: str, thr=0.90) -> bool:
+    if HAS_RAPIDFUZZ:
+        # same Indel-style ratio as SequenceMatcher, C-backed
+        return _rf_fuzz.ratio(_norm_title(a), _norm_title(b)) >= thr * 100
     return difflib.SequenceMatcher(None, _norm_title(a), _norm_title(b)).ratio() >= thr
 
 def _summarize_game_card(it):
+    cached = summary_cache_get(it, kind="game")
+    if cached:
+        return cached
     prompt = (
         "Rewrite two concise paragraphs about the following online casino game item: "
         "first English (max 2 sentences) with key facts; second Hebrew (max 2). "
@@ -474,14 +1377,64 @@ def _summarize_game_card(it):
     )
     en = he = ""
     try:
-        data = _llm_json(prompt)
+        data = _llm_json(prompt, model=SUMMARY_MODEL)
         en = (data.get("en") or "").strip()
         he = (data.get("he") or "").strip()
+        if en or he:
+            summary_cache_set(it, (en, he), kind="game")
     except Exception:
         snippet = " ".join(((it.get("summary") or it.get("title") or "")).split())[:160]
         en, he = (snippet or it.get("title","")), ""
     return en, he
 
+GAME_BATCH_SYSTEM_PROMPT = (
+    "You are a precise iGaming reporter. Be concise. No inventions. "
+    "For EVERY online casino game item in the JSON list you receive, write one concise "
+    "English paragraph (max 2 sentences) with key facts and one concise Hebrew paragraph (max 2). "
+    'Return ONLY JSON: {"summaries":[{"i":0,"en":"...","he":"..."}, ...]} with one entry per input index.'
+)
+
+def _summarize_game_cards(items):
+    """(en, he) per game item: cache first, one batch call, per-item fallback."""
+    out = [None] * len(items)
+    pending = []
+    for i, it in enumerate(items):
+        hit = summary_cache_get(it, kind="game")
+        if hit:
+            out[i] = hit
+        else:
+            pending.append(i)
+    if pending:
+        payload = [{"i": k, "title": items[i].get("title",""), "link": items[i].get("link",""),
+                    "snippet": items[i].get("summary","")}
+                   for k, i in enumerate(pending)]
+        try:
+            data = _llm_json(_json_dumps(payload),
+                             system=GAME_BATCH_SYSTEM_PROMPT,
+                             max_tokens=CARD_MAX_TOKENS * len(pending),
+                             model=SUMMARY_MODEL)
+            for row in (data.get("summaries") or []):
+                try:
+                    k = int(row.get("i"))
+                except Exception:
+                    continue
+                if not (0 <= k < len(pending)):
+                    continue
+                i = pending[k]
+                if out[i] is not None:
+                    continue
+                en = (row.get("en") or "").strip()
+                he = (row.get("he") or "").strip()
+                if en or he:
+                    out[i] = (en, he)
+                    summary_cache_set(items[i], (en, he), kind="game")
+        except Exception:
+            pass
+    for i, v in enumerate(out):
+        if v is None:
+            out[i] = _summarize_game_card(items[i])
+    return out
+
 def build_games_section(collected, focus):
     candidates = []
     for sec in ("news_rss", "games_rss", "bingo_rss", "poker_rss"):
@@ -514,31 +1467,23 @@ def build_games_section(collected, focus):
     used_links = set()
     used_titles = set()
 
-    for it in top:
-        en, he = _summarize_game_card(it)
-        name = html.escape(it.get("title","").strip())
-        link = html.escape(it.get("link","") or "#")
+    summaries = _summarize_game_cards(top)
+    for it, (en, he) in zip(top, summaries):
+        name = _title_html(it)
+        link = _link_html(it)
         en   = html.escape(en)
         he   = html.escape(he)
         used_links.add(it.get("link",""))
         used_titles.add(it.get("title",""))
 
-        cards.append(
-            '<div style="border:1px solid #e6e8eb;border-radius:12px;background:#ffffff;'
-            'box-shadow:0 1px 3px rgba(0,0,0,0.05);padding:14px;margin:10px 0;">'
-            f'<div style="font-size:15px;font-weight:700;margin:0 0 6px;">{name}</div>'
-            f'<p style="margin:0 0 6px;line-height:1.5;font-size:13.5px;color:#1f2937;">{en}</p>'
-            + (f'<p dir="rtl" style="margin:0 12px 8px 0;line-height:1.6;font-size:13.5px;color:#111827;">{he}</p>' if he else "") +
-            f'<a href="{link}" target="_blank" style="display:inline-block;padding:7px 10px;border-radius:8px;'
-            'background:#0369a1;color:#ffffff;text-decoration:none;font-weight:600;font-size:12.5px;">Open source</a>'
-            '</div>'
-        )
+        cards.append(_GAME_CARD_TMPL.format(
+            title=name,
+            en=en,
+            he_block=(_GAME_HE_TMPL.format(he=he) if he else ""),
+            link=link,
+        ))
 
-    header = (
-        '<div style="font-size:18px;font-weight:800;margin:24px 0 8px;'
-        'padding-bottom:6px;border-bottom:1px solid #eceff3;color:#111827;">'
-        '🎮 Top Trending Games in England — 5 to Watch</div>'
-    )
+    header = _SECTION_HEADER_TMPL.format(title="🎮 Top Trending Games in England — 5 to Watch")
     return header + "".join(cards), used_links, used_titles
 
 # ---------- Back to top ----------
@@ -557,14 +1502,21 @@ def build_email(collected, focus):
 
     # 3) Online Casino — UK Focus (≤ NEWS_MAX), without items already used in Games by link OR similar title
     news = collected.get("news_rss", []) or []
+    used_titles_norm = {_norm_title(t) for t in used_titles}
     filtered_news = []
     for it in news:
         if it.get("link") in used_links:
             continue
+        # exact normalized-title hit rejects the common case in O(1);
+        # the fuzzy scan only runs for titles that survive it
+        if _norm_title(it.get("title","")) in used_titles_norm:
+            continue
         if any(_is_title_similar(it.get("title",""), t) for t in used_titles):
             continue
         filtered_news.append(it)
-    news = filtered_news[:NEWS_MAX]
+        if len(filtered_news) >= NEWS_MAX:
+            break
+    news = filtered_news
     news_html = summarize_cards(news, "🎰 Online Casino — UK Focus")
 
     intro = (
@@ -631,66 +1583,151 @@ def build_email(collected, focus):
     return plain, html_body
 
 # ---------- Email ----------
+_smtp = None
+_smtp_lock = threading.Lock()
+
+def get_smtp():
+    """Open the SMTP connection (handshake + login) once and reuse it.
+
+    Called early from a background thread so the 300-800ms of connect/
+    STARTTLS/login overlaps the email build instead of following it.
+    """
+    global _smtp
+    with _smtp_lock:
+        if _smtp is None:
+            s = smtplib.SMTP(SMTP_SERVER, SMTP_PORT, timeout=30)
+            s.starttls()
+            s.login(SMTP_USER, SMTP_PASS)
+            _smtp = s
+        return _smtp
+
+@atexit.register
+def _close_smtp():
+    if _smtp is not None:
+        try:
+            _smtp.quit()
+        except Exception:
+            pass
+
+def _drop_smtp():
+    """Discard the cached connection so the next get_smtp() reconnects."""
+    global _smtp
+    with _smtp_lock:
+        if _smtp is not None:
+            try:
+                _smtp.close()
+            except Exception:
+                pass
+            _smtp = None
+
 def send_mail(subject, plain, html_body):
-    msg = MIMEMultipart('alternative')
+    msg = EmailMessage()
     msg['Subject'] = subject
     msg['From'] = FROM_EMAIL
     msg['To'] = TO_EMAIL
-    msg.attach(MIMEText(plain, 'plain', 'utf-8'))
-    msg.attach(MIMEText(html_body, 'html', 'utf-8'))
-    with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-        server.starttls()
-        server.login(SMTP_USER, SMTP_PASS)
-        server.sendmail(FROM_EMAIL, [TO_EMAIL], msg.as_string())
+    msg.set_content(plain)
+    msg.add_alternative(html_body, subtype='html')
+    # TO_EMAIL may be a comma-separated list; one message, one session
+    recipients = [a.strip() for a in TO_EMAIL.split(',') if a.strip()]
+    try:
+        get_smtp().send_message(msg, to_addrs=recipients)
+    except (smtplib.SMTPException, OSError):
+        # the warmed-up connection can go stale during the LLM-heavy build
+        # (server idle timeout); reconnect once rather than losing the run
+        _drop_smtp()
+        get_smtp().send_message(msg, to_addrs=recipients)
 
 # ---------- Sheets logging ----------
+# Client/spreadsheet/worksheet handles are cached per day so repeated runs in
+# a long-lived process skip the open/auth round-trips.
+_sheets_handles = {}
+
+def _get_sheet_for(today):
+    cached = _sheets_handles.get(today)
+    if cached:
+        return cached
+    info = _json_loads(GOOGLE_SERVICE_ACCOUNT_JSON)
+    creds = Credentials.from_service_account_info(info, scopes=[
+        "https://www.googleapis.com/auth/spreadsheets",
+        "https://www.googleapis.com/auth/drive"
+    ])
+    gc = gspread.authorize(creds)
+    try:
+        sh = gc.open(SHEETS_SPREADSHEET)
+    except Exception:
+        sh = gc.create(SHEETS_SPREADSHEET)
+    try:
+        sh.worksheet(today)
+    except Exception:
+        ws = sh.add_worksheet(title=today, rows=1000, cols=6)
+        ws.update('A1:F1', [["section","title","link","snippet","source","logged_at_utc"]])
+    _sheets_handles[today] = sh
+    return sh
+
+_NL_TRANS = str.maketrans("\n\r", "  ")
+
 def try_log_to_sheets(collected):
     if not HAS_SHEETS or not GOOGLE_SERVICE_ACCOUNT_JSON:
         return
     try:
-        info = json.loads(GOOGLE_SERVICE_ACCOUNT_JSON)
-        creds = Credentials.from_service_account_info(info, scopes=[
-            "https://www.googleapis.com/auth/spreadsheets",
-            "https://www.googleapis.com/auth/drive"
-        ])
-        gc = gspread.authorize(creds)
-        try:
-            sh = gc.open(SHEETS_SPREADSHEET)
-        except Exception:
-            sh = gc.create(SHEETS_SPREADSHEET)
         today = datetime.datetime.utcnow().strftime("%Y-%m-%d")
-        try:
-            ws = sh.worksheet(today)
-        except Exception:
-            ws = sh.add_worksheet(title=today, rows=1000, cols=6)
-            ws.update('A1:F1', [["section","title","link","snippet","source","logged_at_utc"]])
+        sh = _get_sheet_for(today)
         rows = []
         now = datetime.datetime.utcnow().isoformat()
         for section, arr in collected.items():
+            if section.startswith("_") or not isinstance(arr, list):
+                continue  # meta entries like _games_fallback_urls
             for it in arr:
-                snippet = (it.get("summary","")[:200]).replace("\n"," ")
+                snippet = it.get("summary", "")[:200].translate(_NL_TRANS)
                 rows.append([section, it.get("title",""), it.get("link",""), snippet, it.get("source",""), now])
         if rows:
-            ws.append_rows(rows, value_input_option="USER_ENTERED")
+            # single values.append call (append semantics, unlike batchUpdate
+            # which would overwrite from A1 on reruns within the same day)
+            # RAW skips the server-side cell parsing USER_ENTERED does (the
+            # columns are plain strings, and it also can't run formulas)
+            sh.values_append(f"'{today}'!A:F",
+                             params={"valueInputOption": "RAW"},
+                             body={"values": rows})
     except Exception as e:
         print("Sheets logging skipped/error:", e)
 
 # ---------- Main ----------
 if __name__ == "__main__":
+    if _summary_cache is not None:
+        _summary_cache.expire()  # drop entries past their TTL
+
     src = load_sources()
     focus = parse_focus(src)
     major_terms = (src.get("major_keywords", []) or src.get("focus", {}).get("major_keywords", []))
 
     collected = {}
 
-    # RSS buckets
-    for section in ["news_rss", "poker_rss", "bingo_rss", "games_rss"]:
-        urls = src.get(section, []) or []
-        items = collect_rss_items(section, urls)
-        items = dedup_items(items)
-        if section in ("poker_rss", "bingo_rss") and MAJOR_ONLY_NON_CASINO:
-            items = [it for it in items if is_major(f"{it['title']} {it['summary']}", major_terms)]
-        items = apply_focus_filter(items, focus, major_terms)
+    # RSS buckets — fetch every (section, url) pair concurrently; dedup and
+    # the non-casino major filter run inline during extraction (single pass)
+    sections = ["news_rss", "poker_rss", "bingo_rss", "games_rss"]
+    non_casino = ("poker_rss", "bingo_rss")
+    pairs = [(section, url) for section in sections for url in (src.get(section, []) or [])]
+    section_items = {section: [] for section in sections}
+    # one seen-set across ALL sections: a story syndicated into two buckets
+    # should only be kept (and later summarized) once
+    seen_keys = set()
+    if pairs:
+        with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(pairs))) as ex:
+            futures = {ex.submit(fetch_feed, url): (section, url) for section, url in pairs}
+            for fut in as_completed(futures):
+                section, url = futures[fut]
+                try:
+                    d = fut.result()
+                except Exception:
+                    continue
+                section_items[section].extend(extract_feed_items(
+                    section, url, d,
+                    dedup_seen=seen_keys,
+                    major_terms=(major_terms if (section in non_casino and MAJOR_ONLY_NON_CASINO) else None),
+                ))
+
+    for section in sections:
+        items = apply_focus_filter(section_items[section], focus, major_terms)
         if MAX_ITEMS_PER_SECTION > 0:
             items = items[:MAX_ITEMS_PER_SECTION]
         collected[section] = items
@@ -706,13 +1743,30 @@ if __name__ == "__main__":
     must_urls = (src.get("must_include", {}) or {}).get("urls", []) or []
     manual_items = inject_must_include(must_urls)
     if manual_items:
-        merged = (collected.get("news_rss") or []) + manual_items
-        collected["news_rss"] = dedup_items(merged)
-        collected["news_rss"] = apply_focus_filter(collected["news_rss"], focus, major_terms)
-
-    try_log_to_sheets(collected)
+        # the feed items were already focus-filtered; only score the new
+        # manual ones, then dedup the merge
+        manual_items = apply_focus_filter(manual_items, focus, major_terms)
+        collected["news_rss"] = dedup_items((collected.get("news_rss") or []) + manual_items)
+
+    # Collapse near-identical news coverage before any LLM spend
+    collected["news_rss"] = collapse_near_duplicates(collected.get("news_rss") or [])
+
+    # Sheets logging only reads `collected`, so it can run in the background
+    # while the (much slower) LLM email build happens on the main thread;
+    # the SMTP handshake warms up alongside it for the same reason.
+    _bg = ThreadPoolExecutor(max_workers=2)
+    sheets_future = _bg.submit(try_log_to_sheets, collected)
+    _bg.submit(get_smtp)
     plain, html_body = build_email(collected, focus)
+    try:
+        sheets_future.result(timeout=30)
+    except Exception as e:
+        print("Sheets logging did not finish:", e)
+    _bg.shutdown(wait=False)
+    save_feed_state()  # after build_email so the games-fallback fetches are included
     today = datetime.datetime.utcnow().strftime("%Y-%m-%d")
     subject = f"Weekly Gambling Digest — {today} (UK Focus)"
     send_mail(subject, plain, html_body)
+    if DEBUG:
+        print("LLM response cache:", _llm_cache_stats)
     print("Digest prepared and (if SMTP is valid) sent.")